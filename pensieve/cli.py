@@ -2,88 +2,102 @@
 
 import argparse
 import collections
-import inspect
-import io
-import json
+import collections.abc
+import functools
+import operator
 import os
 import pathlib
-import shutil
-import subprocess
+import pickle
 import sys
-import textwrap
 
-import yaml
+from . import exceptions, dotfile, fastjson
 
-from . import exceptions, settings, dotfile
-from .clients import GitHubClient
 
+@functools.lru_cache(maxsize=1)
+def _config_path():
+    """The path of the dotfile. Override with PENSIEVE_CONFIG_PATH."""
+    path = os.getenv("PENSIEVE_CONFIG_PATH")
+    if path:
+        return pathlib.Path(path)
+    return pathlib.Path.home() / ".config" / "pensieve" / "pensieve.yaml"
 
-# check to see if the system has fzf installed. If it does, we will allow selecting
-# repositories to clone with fzf
-HAS_FZF = bool(shutil.which("fzf"))
 
-CONFIG_PATH = os.getenv('PENSIEVE_CONFIG_PATH',
-        pathlib.Path.home() / '.config' / 'pensieve' / 'pensieve.yaml'
-        )
+@functools.lru_cache(maxsize=1)
+def _cache_path():
+    """The directory of the repository cache. Override with PENSIEVE_CACHE_PATH."""
+    path = os.getenv("PENSIEVE_CACHE_PATH")
+    if path:
+        return pathlib.Path(path)
+    return pathlib.Path.home() / ".cache" / "pensieve" / "cache"
+
+
+def _legacy_cache_path():
+    """The cache file written in the old single-file JSON format, or None.
 
-CACHE_PATH = os.getenv('PENSIEVE_CACHE_PATH',
-        pathlib.Path.home() / '.cache/pensieve/cache.json')
+    PENSIEVE_CACHE_PATH used to name that file, so it is either the cache path
+    itself or, if the path has lost its .json suffix, the path with it added.
+
+    """
+    for path in (_cache_path(), _cache_path().with_suffix(".json")):
+        if path.is_file():
+            return path
+    return None
 
 
-# get the size of the terminal. The terminal may not exist; if not, assume a standard size.
-try:
-    _, COLUMNS = os.popen("stty size", "r").read().split()
-    COLUMNS = int(COLUMNS)
-except ValueError:
-    COLUMNS = 120
+@functools.lru_cache(maxsize=1)
+def _columns():
+    """Get the width of the terminal. The terminal may not exist; if not, assume
+    a standard size."""
+    import shutil
+
+    return shutil.get_terminal_size((120, 24)).columns
+
 
 # output formatting
 # =============================================================================
 
 
-def _colorizer(wrapped):
-    """Decorator to return unformatted message if PENSIEVE_COLOR is set."""
+# color is disabled by setting PENSIEVE_COLOR=no. this is decided once: the
+# escape sequences below are empty when color is off, so messages can be
+# formatted by plain concatenation without consulting the environment
+_COLOR_ON = os.getenv("PENSIEVE_COLOR", "yes") != "no"
 
-    def wrapper(message):
-        if os.getenv("PENSIEVE_COLOR", "yes") == "no":
-            return message
 
-        return wrapped(message)
+def _escape(code):
+    return code if _COLOR_ON else ""
 
-    return wrapper
 
+_RESET = _escape("\u001b[0m")
+_FADED = _RESET
+_INFO = _escape("\u001b[35m")
+_INFO_HEADING = _escape("\u001b[34m")
+_HIGHLIGHT = _escape("\u001b[37;1m")
+_BAD = _escape("\u001b[31m")
+_GOOD = _escape("\u001b[32m")
 
-_RESET = "\u001b[0m"
 
-
-@_colorizer
 def faded(message):
-    return _RESET + message + _RESET
+    return _FADED + message + _RESET
 
 
-@_colorizer
 def info(message):
-    return "\u001b[35m" + message + _RESET
+    return _INFO + message + _RESET
 
 
-@_colorizer
 def info_heading(message):
-    return "\u001b[34m" + message + _RESET
+    return _INFO_HEADING + message + _RESET
 
 
-@_colorizer
 def highlight(message):
-    return "\u001b[37;1m" + message + _RESET
+    return _HIGHLIGHT + message + _RESET
 
 
-@_colorizer
 def bad(message):
-    return "\u001b[31m" + message + _RESET
+    return _BAD + message + _RESET
 
 
-@_colorizer
 def good(message):
-    return "\u001b[32m" + message + _RESET
+    return _GOOD + message + _RESET
 
 
 def fatal_error(msg, code=1):
@@ -97,6 +111,12 @@ def fatal_error(msg, code=1):
 # a repository locator string provides all the information needed to locate
 # a repository
 
+# the result of parsing a repository locator
+Location = collections.namedtuple(
+    "RepoPath",
+    ["store_name", "client", "user_or_org_prefix", "repo_name", "full_name"],
+)
+
 
 def parse_repository_locator(locator_string, clients):
     """Parse a repository locator string into pieces.
@@ -117,9 +137,8 @@ def parse_repository_locator(locator_string, clients):
         A namedtuple with attributes: store_name, client, user_or_org_prefix,
         repo_name, and full_name. The full_name can be used to clone the repository.
     """
-    try:
-        store, rest = locator_string.split(":")
-    except Exception:
+    store, sep, rest = locator_string.partition(":")
+    if not sep:
         raise ValueError("Must include store name.")
 
     if store not in clients:
@@ -127,23 +146,23 @@ def parse_repository_locator(locator_string, clients):
     else:
         client = clients[store]
 
-    if "/" in rest:
-        parts = rest.split("/")
-        user_or_org_prefix = parts[0] + "/"
-        repo_name = parts[1]
+    user_or_org, sep, repo_name = rest.partition("/")
+    if "/" in repo_name:
+        raise ValueError("Repository name may have at most one user or org prefix.")
+
+    if sep:
+        user_or_org_prefix = user_or_org + "/"
     else:
         user_or_org_prefix = ""
-        repo_name = rest
+        repo_name = user_or_org
+
+    from .clients import GitHubClient
 
     if isinstance(client, GitHubClient) and not user_or_org_prefix:
         user_or_org_prefix = client.user + "/"
 
     full_name = user_or_org_prefix + repo_name
 
-    Location = collections.namedtuple(
-        "RepoPath",
-        ["store_name", "client", "user_or_org_prefix", "repo_name", "full_name"],
-    )
     return Location(store, client, user_or_org_prefix, repo_name, full_name)
 
 
@@ -160,11 +179,192 @@ def RepositoryLocator(clients):
     def checker(value):
         try:
             return parse_repository_locator(value, clients)
-        except ValueError as exc:
+        except (ValueError, exceptions.Error) as exc:
             raise argparse.ArgumentTypeError(str(exc))
 
     return checker
 
+# the repository cache
+# =============================================================================
+# information about the repositories on each store is cached so that it can be
+# used without contacting the stores, e.g., for autocompletion. each store's
+# repositories are kept in a separate file (a shard) in the cache directory, so
+# updating one store doesn't require rewriting the others.
+
+# the first byte of each shard identifies its format. it is bumped whenever
+# the format changes, so that shards written by other versions are recognized
+_CACHE_FORMAT = b"\x01"
+
+# shards which have been read or written, along with the stat information of
+# each at that time, so that a shard is decoded at most once per process
+_CACHE_MEMO = {}
+
+
+def _write_atomically(path, data, mode=0o666):
+    """Write bytes to a file by way of a temporary file and a rename.
+
+    Readers never observe a partially-written file, even if the process dies
+    while writing. The temporary file is named after the process so that two
+    concurrent runs do not write into the same one.
+
+    """
+    tmp_path = path.with_name("{}.{}.tmp".format(path.name, os.getpid()))
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        with os.fdopen(fd, "wb") as fileobj:
+            fileobj.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_private_file(path):
+    """Read a file, but only if it belongs to this user and nobody else can
+    write to it; otherwise, raise PermissionError.
+
+    The cache files are pickles, and unpickling can run arbitrary code, so a
+    file planted by someone else must never be decoded.
+
+    """
+    with path.open("rb") as fileobj:
+        st = os.fstat(fileobj.fileno())
+        if st.st_uid != os.getuid() or st.st_mode & 0o022:
+            raise PermissionError(f"{path} may have been written by someone else.")
+        return fileobj.read()
+
+
+def _cache_key(path):
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _shard_path(store):
+    return _cache_path() / (store + ".pkl")
+
+
+def _etags_path(store):
+    return _cache_path() / (store + ".etags")
+
+
+def _encode_cache_file(obj):
+    """The cache is only read by pensieve itself, so its files are stored in a
+    binary format: a format byte followed by a pickle."""
+    return _CACHE_FORMAT + pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_cache_file(data, default):
+    """Decode a cache file, returning `default` if it is in an unknown format.
+    The file will be rewritten the next time `pensieve list` is run."""
+    try:
+        return pickle.loads(data[1:]) if data[:1] == _CACHE_FORMAT else default
+    except Exception:
+        return default
+
+
+def _write_shard(store, repos):
+    """Write information about the repos on a store to its shard.
+
+    A shard contains a list of `(name, description, topics)` tuples, one for
+    each repo, sorted by name. The topics are stored as a frozenset, so that
+    they are ready for membership tests and unions when read.
+
+    """
+    repos = sorted(
+        ((name, desc, frozenset(topics)) for name, desc, topics in repos),
+        key=operator.itemgetter(0),
+    )
+    path = _shard_path(store)
+    path.parent.mkdir(exist_ok=True, parents=True)
+    _write_atomically(path, _encode_cache_file(repos), mode=0o600)
+    _CACHE_MEMO[path] = (_cache_key(path), repos)
+
+
+def _read_shard(path):
+    """Read the repos in a shard."""
+    key = _cache_key(path)
+    memo = _CACHE_MEMO.get(path)
+    if memo is not None and memo[0] == key:
+        return memo[1]
+
+    try:
+        repos = _decode_cache_file(_read_private_file(path), [])
+    except PermissionError:
+        repos = []
+    _CACHE_MEMO[path] = (key, repos)
+    return repos
+
+
+def _write_etags(store, etags):
+    """Save the ETags of a GitHub store's listing; see `GitHubClient.etags`."""
+    path = _etags_path(store)
+    path.parent.mkdir(exist_ok=True, parents=True)
+    _write_atomically(path, _encode_cache_file(etags), mode=0o600)
+
+
+def _read_etags(store):
+    try:
+        return _decode_cache_file(_read_private_file(_etags_path(store)), {})
+    except (FileNotFoundError, PermissionError):
+        return {}
+
+
+def _migrate_legacy_cache():
+    """Split a cache left in the old single-file JSON format into shards.
+
+    Shards which already exist are newer than the old cache, and are kept.
+
+    """
+    legacy_path = _legacy_cache_path()
+    if legacy_path is None:
+        return
+
+    try:
+        data = legacy_path.read_bytes()
+    except FileNotFoundError:
+        return
+
+    # the old cache may be where the cache directory now goes, so it is
+    # removed before any shards are written
+    legacy_path.unlink()
+
+    try:
+        legacy = fastjson.loads(data)
+    except ValueError:
+        return
+
+    for store, repos in legacy.items():
+        if not _shard_path(store).exists():
+            repos = [(r["name"], r["description"], tuple(r["topics"])) for r in repos]
+            _write_shard(store, repos)
+
+
+class _Cache(collections.abc.Mapping):
+    """The cached repos of each store, keyed by store name.
+
+    A store's shard is only read when its repos are accessed.
+
+    """
+
+    def __init__(self, shard_paths):
+        self._shard_paths = shard_paths
+
+    def __getitem__(self, store):
+        return _read_shard(self._shard_paths[store])
+
+    def __iter__(self):
+        return iter(self._shard_paths)
+
+    def __len__(self):
+        return len(self._shard_paths)
+
+
+def _read_cache():
+    _migrate_legacy_cache()
+    shard_paths = {path.stem: path for path in sorted(_cache_path().glob("*.pkl"))}
+    return _Cache(shard_paths)
+
+
 # commands
 # =============================================================================
 
@@ -205,9 +405,18 @@ def cmd_new(args):
 # if fzf is available, running pensieve clone without arguments will start fzf
 # so that the user can interactively select the repository to clone
 
+@functools.lru_cache(maxsize=1)
+def _has_fzf():
+    """Check to see if the system has fzf installed. If it does, we will allow
+    selecting repositories to clone with fzf."""
+    import shutil
+
+    return bool(shutil.which("fzf"))
+
+
 def configure_clone_parser(subparsers, clients):
     # if fzf is available, we make the 
-    if HAS_FZF:
+    if _has_fzf():
         nargs = "?"
     else:
         nargs = 1
@@ -231,13 +440,21 @@ def configure_clone_parser(subparsers, clients):
 
 def _fzf_select_repo():
     """Open fzf and select a repo from the cache."""
+    import subprocess
+
     cache = _read_cache()
-    names = _cached_names(cache)
 
-    result = subprocess.run(
-        "fzf", input="\n".join(names).encode(), stdout=subprocess.PIPE
-    )
-    return result.stdout.decode().strip()
+    # names are written to fzf as they are produced so that it can start
+    # matching right away; communicate() closes stdin once they are all sent
+    proc = subprocess.Popen(["fzf"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    try:
+        proc.stdin.writelines(_cached_name_lines(cache))
+    except BrokenPipeError:
+        # fzf exited, e.g., because a selection was made, before every name
+        # was sent
+        pass
+    stdout, _ = proc.communicate()
+    return stdout.decode().strip()
 
 
 def cmd_clone(args):
@@ -270,69 +487,107 @@ def configure_list_parser(subparsers, clients):
     list_parser.set_defaults(cmd=cmd_list)
 
 
-def _format_meta(msg, level=0, spacer="    "):
-    """Indent the first line once, the remaining lines twice."""
-    lines = textwrap.wrap(msg, COLUMNS)
-    msg = spacer * level + lines[0]
-    if len(lines) > 1:
-        msg += "\n" + textwrap.indent("\n".join(lines[1:]), prefix=spacer * (level + 1))
-    return msg
+_WHITESPACE = str.maketrans("\n\r\v\f", "    ")
 
 
-def _update_cache(store, repos_on_store):
-    """Update the cache file with information about the repos on the store.
-
-    Creates a JSON file named `CACHE_PATH` in the pensieve directory. The
-    file is a JSON dict whose keys are the store names. The value is a list
-    of dictionaries, one for each repo, each dictionary containing attributes
-    `name`, `topics`, and `description`.
+def _wrap(msg, width):
+    """Greedily wrap a message into lines of at most `width` characters.
 
+    A lighter stand-in for textwrap.wrap: each line is broken at the last space
+    that fits. As in textwrap, a word longer than a line is split so that it
+    starts on the current line.
     """
-    cache_path = pathlib.Path(CACHE_PATH)
-    if not cache_path.parent.is_dir():
-        cache_path.parent.mkdir(exist_ok=True, parents=True)
-
-    try:
-        with cache_path.open() as fileobj:
-            cache = json.load(fileobj)
-    except FileNotFoundError:
-        cache = {}
+    # as in textwrap, tabs are expanded and other whitespace becomes a space,
+    # so that a newline in the message can't escape the indentation
+    msg = msg.expandtabs().translate(_WHITESPACE).strip()
+    while len(msg) > width:
+        cut = msg.rfind(" ", 0, width + 1)
+        word_end = msg.find(" ", cut + 1)
+        if word_end == -1:
+            word_end = len(msg)
+        if cut == -1 or word_end - cut - 1 > width:
+            cut = width
+        yield msg[:cut].rstrip()
+        msg = msg[cut:].lstrip()
+    if msg:
+        yield msg
 
-    cache[store] = [r._asdict() for r in repos_on_store]
 
-    with cache_path.open("w") as fileobj:
-        json.dump(cache, fileobj)
+def _format_meta(msg, level=0, spacer="    "):
+    """Indent the first line once, the remaining lines twice."""
+    lines = list(_wrap(msg, _columns()))
+    msg = spacer * level + lines[0]
+    if len(lines) > 1:
+        newline = "\n" + spacer * (level + 1)
+        msg += newline + newline.join(lines[1:])
+    return msg
 
 
 def cmd_list(args):
-    for store in sorted(args.clients):
-        client = args.clients[store]
-
-        repos_on_store = client.list()
-        _update_cache(store, repos_on_store)
-
-        for repo in sorted(repos_on_store):
-            if args.topic is not None and args.topic not in repo.topics:
-                continue
-
-            if "archived" in repo.topics and not args.show_archived:
-                continue
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .clients import GitHubClient
+
+    # an old cache may sit where the cache directory goes, and must be moved
+    # out of the way before any shards are written
+    _migrate_legacy_cache()
+
+    # GitHub stores can skip downloading pages that haven't changed since the
+    # last listing
+    for store, client in args.clients.items():
+        if isinstance(client, GitHubClient):
+            client.etags = _read_etags(store)
+
+    # listing a store is a network round trip, so all stores are queried at
+    # once. results are consumed in sorted order so output order is unchanged,
+    # and each store is printed as soon as it and the stores before it are done
+    with ThreadPoolExecutor(max_workers=max(1, len(args.clients))) as executor:
+        futures = {
+            store: executor.submit(args.clients[store].list)
+            for store in sorted(args.clients)
+        }
+
+        for store, future in futures.items():
+            # sorted once, so that the cache also lists repos in order
+            repos_on_store = sorted(future.result(), key=operator.attrgetter("name"))
+            _write_shard(store, [r.astuple() for r in repos_on_store])
+            if isinstance(args.clients[store], GitHubClient):
+                _write_etags(store, args.clients[store].etags)
+
+            # each store's output is written at once, rather than line by line
+            lines = []
+            for repo in repos_on_store:
+                if args.topic is not None and args.topic not in repo.topics:
+                    continue
+
+                if "archived" in repo.topics and not args.show_archived:
+                    continue
+
+                topics = ", ".join(repo.topics)
+                lines.append(
+                    f"{_HIGHLIGHT}{repo.name}{_RESET}{_FADED} :: {store}{_RESET}"
+                )
 
-            topics = ", ".join(repo.topics)
-            print(highlight(repo.name) + faded(f" :: {store}"))
+                if repo.description is not None:
+                    lines.append(
+                        _format_meta(
+                            f"{_INFO_HEADING}description{_RESET}: "
+                            f"{_INFO}{repo.description}{_RESET}",
+                            level=1,
+                        )
+                    )
 
-            if repo.description is not None:
-                print(
-                    _format_meta(
-                        f"{info_heading('description')}: {info(repo.description)}",
-                        level=1,
+                if topics:
+                    lines.append(
+                        _format_meta(
+                            f"{_INFO_HEADING}topics{_RESET}: {_INFO}{topics}{_RESET}",
+                            level=1,
+                        )
                     )
-                )
 
-            if topics:
-                print(
-                    _format_meta(f"{info_heading('topics')}: {info(topics)}", level=1)
-                )
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
 
 # pensieve cached
 # ---------------
@@ -347,67 +602,109 @@ def configure_cached_parser(subparsers, clients):
     cached_parser.set_defaults(cmd=cmd_cached)
 
 
-def _read_cache():
-    cache_path = pathlib.Path.cwd() / CACHE_PATH
-
-    try:
-        with cache_path.open() as fileobj:
-            cache = json.load(fileobj)
-    except FileNotFoundError:
-        cache = {}
-
-    return cache
-
-
 def _cached_topics(cache):
     """Extract the set of topics from the cache."""
-    topics = set()
-    for store, repos in cache.items():
-        for repo in repos:
-            topics.update(repo["topics"])
-    return topics
+    return set().union(*(topics for repos in cache.values() for _, _, topics in repos))
 
 
 def _cached_names(cache):
     """
-    Extract all repo names from the cache.
+    Lazily extract all repo names from the cache.
 
     Format: <store_name>:<full_repo_name>, so that the repo can be cloned by
     writing pensieve clone <store_name> <full_repo_name>.
     """
-    names = []
+    return (store + ":" + repo[0] for store, repos in cache.items() for repo in repos)
+
+
+def _cached_name_lines(cache):
+    """Like `_cached_names`, but as encoded, newline-terminated lines which are
+    ready to be written to another process."""
     for store, repos in cache.items():
+        prefix = store.encode() + b":"
         for repo in repos:
-            name = store + ":" + repo["name"]
-            names.append(name)
-    return names
+            yield prefix + repo[0].encode() + b"\n"
 
 
 def cmd_cached(args):
     """Print info from the cache for usage in other scripts."""
     cache = _read_cache()
     if args.what == "stores":
-        print("\n".join(cache.keys()))
+        lines = cache.keys()
     elif args.what == "topics":
-        topics = _cached_topics(cache)
-        print("\n".join(topics))
+        lines = sorted(_cached_topics(cache))
     elif args.what == "names":
-        names = _cached_names(cache)
-        print("\n".join(names))
+        lines = _cached_names(cache)
+
+    sys.stdout.writelines(line + "\n" for line in lines)
 
     sys.exit()
 
+
+# the function which configures the parser of each subcommand
+SUBCOMMANDS = {
+    "clone": configure_clone_parser,
+    "list": configure_list_parser,
+    "new": configure_new_parser,
+    "cached": configure_cached_parser,
+}
+
 # main
 # =============================================================================
 
+def _dotfile_cache_path():
+    """The parsed dotfile is cached in the repository cache directory."""
+    return _cache_path() / "dotfile.cache"
+
+
+def _load_clients():
+    """Load the clients defined in the dotfile.
+
+    Parsing YAML is comparatively slow, so the parsed configuration is pickled
+    to a side file along with a key made from the dotfile's path and stat
+    information. If the key still matches on the next run, the YAML is not
+    parsed at all. Since unpickling can run arbitrary code, the side file is
+    only read if it belongs to the user and nobody else can write to it.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the dotfile does not exist.
+    Error
+        If there was a problem reading the dotfile.
+
+    """
+    config_path = _config_path()
+    st = config_path.stat()
+    key = (str(config_path), st.st_mtime_ns, st.st_size, st.st_ino)
+
+    cache_path = _dotfile_cache_path()
+    try:
+        cached_key, config = pickle.loads(_read_private_file(cache_path))
+    except Exception:
+        cached_key = None
+
+    if cached_key != key:
+        config = dotfile.parse(config_path.read_bytes())
+
+        # the cache is only an optimization; failing to write it is not an error
+        try:
+            cache_path.parent.mkdir(exist_ok=True, parents=True)
+            # the dotfile contains API tokens, so keep the copy private
+            _write_atomically(cache_path, pickle.dumps((key, config)), mode=0o600)
+        except OSError:
+            pass
+
+    return dotfile.from_config(config, lazy=True)
+
+
 def main():
     try:
-        with pathlib.Path(CONFIG_PATH).open() as fileobj:
-            clients = dotfile.load(fileobj)
+        clients = _load_clients()
     except exceptions.Error as exc:
         fatal_error("Error: " + str(exc))
     except FileNotFoundError:
-        fatal_error(f"Pensieve dotfile not found at {CONFIG_PATH}.")
+        fatal_error(f"Pensieve dotfile not found at {_config_path()}.")
 
     description = """
         Create, clone, and list git repositories hosted elsewhere.
@@ -417,10 +714,15 @@ def main():
     parser.set_defaults(cwd=pathlib.Path.cwd(), clients=clients)
     subparsers = parser.add_subparsers()
 
-    configure_clone_parser(subparsers, clients)
-    configure_list_parser(subparsers, clients)
-    configure_new_parser(subparsers, clients)
-    configure_cached_parser(subparsers, clients)
+    # only the subparser of the requested subcommand is built. if the
+    # subcommand can't be determined, all are built so that help and error
+    # messages are complete
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command in SUBCOMMANDS:
+        SUBCOMMANDS[command](subparsers, clients)
+    else:
+        for configure_parser in SUBCOMMANDS.values():
+            configure_parser(subparsers, clients)
 
     args = parser.parse_args()
 
@@ -432,3 +734,5 @@ def main():
         args.cmd(args)
     except exceptions.Error as exc:
         fatal_error("Error: " + str(exc))
+    finally:
+        clients.close()
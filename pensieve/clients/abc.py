@@ -7,14 +7,50 @@ including: cloning repos, creating new repos, listing all of the repos, etc.
 
 
 import abc
-import collections
+import dataclasses
 
 
-# a simple data container for repository information
-RepositoryMetadata = collections.namedtuple("Repository", "name description topics")
+@dataclasses.dataclass(frozen=True, order=True)
+class RepositoryMetadata:
+    """A simple data container for repository information."""
+
+    __slots__ = ("name", "description", "topics")
+
+    name: str
+    description: str
+    topics: list
+
+    # a frozen dataclass with slots can't be copied or pickled by default, as
+    # that sets its attributes one by one; this is what slots=True generates
+    def __getstate__(self):
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    def astuple(self):
+        """The repository information as a compact tuple, as stored in the cache."""
+        return (self.name, self.description, tuple(self.topics))
 
 
 class ClientABC(abc.ABC):
+    """A client of a store.
+
+    Clients may hold open connections to their store. They can be used as
+    context managers, or closed explicitly with `close()`.
+
+    """
+
+    def close(self):
+        """Release any connections held by the client."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     @abc.abstractmethod
     def clone(self, repo_name, cwd):
         """Clone the repository into the current working directory.
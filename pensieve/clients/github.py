@@ -5,15 +5,21 @@ associated with a user account. It requires an API token.
 
 """
 
-import collections
+import base64
 import itertools
-import requests
 import subprocess
 
+import urllib3
+
 from .abc import ClientABC, RepositoryMetadata
+from .. import fastjson
 from ..exceptions import ClientError
 
 
+# how many pages of repositories are requested from the API at once when listing
+PAGE_BATCH_SIZE = 8
+
+
 def _make_error_message(json):
     """Given a JSON response from the API, format a nice error message."""
     return json["message"] + " " + json["errors"][0]["message"]
@@ -28,7 +34,9 @@ def _extract_repo_info_from_json(json):
 
     """
     return RepositoryMetadata(
-        name=json["full_name"], description=json["description"], topics=json["topics"]
+        name=json["full_name"],
+        description=json["description"],
+        topics=sorted(json["topics"]),
     )
 
 
@@ -42,11 +50,75 @@ class GitHubClient(ClientABC):
     token : str
         The API token used for authentication.
 
+    Attributes
+    ----------
+    etags : Dict[int, Tuple[str, int, List[tuple]]]
+        For each page of the repository listing, the ETag of the last response
+        along with the number of repositories on the page and the tuples of
+        the ones listed. Requests for a page which hasn't changed are answered
+        from here. It is updated by `list()`, and can be saved and restored
+        between runs.
+
     """
 
     def __init__(self, user, token):
         self.user = user
         self.token = token
+        self.etags = {}
+
+        credentials = base64.b64encode(f"{user}:{token}".encode()).decode()
+        self._headers = {
+            "Authorization": "Basic " + credentials,
+            # must have the right Accept header to get topics
+            "Accept": "application/vnd.github.mercy-preview+json",
+        }
+
+        # all requests share one pool, so that connections to the API are
+        # kept alive and reused rather than re-established for every request
+        self._pool = urllib3.PoolManager(num_pools=1, maxsize=PAGE_BATCH_SIZE)
+
+    def close(self):
+        """Close the connections to the API."""
+        self._pool.clear()
+
+    def _request(self, method, url, headers=None, **kwargs):
+        """Make a request to the API.
+
+        Arguments
+        ---------
+        method : str
+            The HTTP method.
+        url : str
+            The URL of the endpoint.
+        headers : dict
+            Headers to send in addition to the authentication headers.
+        kwargs
+            Passed on to `urllib3.PoolManager.request`.
+
+        Returns
+        -------
+        urllib3.HTTPResponse
+
+        Raises
+        ------
+        ClientError
+            If the API could not be reached.
+
+        """
+        try:
+            return self._pool.request(
+                method, url, headers={**self._headers, **(headers or {})}, **kwargs
+            )
+        except urllib3.exceptions.HTTPError as exc:
+            raise ClientError(f"Could not reach the GitHub API: {exc}")
+
+    def _post_json(self, url, data):
+        return self._request(
+            "POST",
+            url,
+            headers={"Content-Type": "application/json"},
+            body=fastjson.dumps(data),
+        )
 
     def clone(self, full_name, cwd):
         """Clone the repository into the current working directory.
@@ -67,33 +139,28 @@ class GitHubClient(ClientABC):
         # if a full name is not provided, assume the user is self.user
         url = f"ssh://git@github.com/{full_name}"
         command = ["git", "clone", url]
-        proc = subprocess.run(
-            command,
-            cwd=str(cwd),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-        )
+        # git reports errors on stderr, so only that is captured; stdout is
+        # left connected to the terminal rather than buffered here
+        proc = subprocess.run(command, cwd=str(cwd), stderr=subprocess.PIPE)
 
         if proc.returncode:
-            raise ClientError(proc.stdout.decode())
+            raise ClientError(proc.stderr.decode())
 
     def _create_new_user_repository(self, repo_name, private):
-        result = requests.post(
+        result = self._post_json(
             "https://api.github.com/user/repos",
-            auth=(self.user, self.token),
-            json={"name": repo_name, "private": private},
+            {"name": repo_name, "private": private},
         )
-        if result.status_code != 201:
-            raise ClientError(_make_error_message(result.json()))
+        if result.status != 201:
+            raise ClientError(_make_error_message(fastjson.loads(result.data)))
 
     def _create_new_org_repository(self, org, repo_name, private):
-        result = requests.post(
+        result = self._post_json(
             f"https://api.github.com/orgs/{org}/repos",
-            auth=(self.user, self.token),
-            json={"name": repo_name, "private": private},
+            {"name": repo_name, "private": private},
         )
-        if result.status_code != 201:
-            raise ClientError(_make_error_message(result.json()))
+        if result.status != 201:
+            raise ClientError(_make_error_message(fastjson.loads(result.data)))
 
     def new(self, full_name, private=True):
         """Create a new repository on the store.
@@ -128,25 +195,65 @@ class GitHubClient(ClientABC):
             and `.topics` attributes.
 
         """
-        repos = []
+        from concurrent.futures import ThreadPoolExecutor
 
         def is_admin(r):
             return r["permissions"]["admin"]
 
-        for page in itertools.count(1):
-            # must have the right Accept header to get topics
-            results = requests.get(
-                f"https://api.github.com/user/repos",
-                auth=(self.user, self.token),
-                params={"per_page": 100, "page": page},
-                headers={"Accept": "application/vnd.github.mercy-preview+json"},
+        def get_page(page):
+            # if the page was seen before, the API responds with 304 Not
+            # Modified and no body when it hasn't changed since
+            cached = self.etags.get(page)
+            headers = {"If-None-Match": cached[0]} if cached else {}
+
+            results = self._request(
+                "GET",
+                "https://api.github.com/user/repos",
+                fields={"per_page": "100", "page": str(page)},
+                headers=headers,
             )
-            if not results.json():
-                break
+            if cached and results.status == 304:
+                return cached[1:]
 
+            if results.status >= 400:
+                raise ClientError(
+                    f"Listing repositories failed with status {results.status}."
+                )
+
+            page_json = fastjson.loads(results.data)
+            size = len(page_json)
             repos_on_page = [
-                _extract_repo_info_from_json(r) for r in results.json() if is_admin(r)
+                _extract_repo_info_from_json(r).astuple()
+                for r in page_json
+                if is_admin(r)
             ]
-            repos.extend(repos_on_page)
+
+            etag = results.headers.get("ETag")
+            if etag is not None:
+                self.etags[page] = (etag, size, repos_on_page)
+
+            return size, repos_on_page
+
+        def get_pages():
+            with ThreadPoolExecutor(max_workers=PAGE_BATCH_SIZE) as executor:
+                for first in itertools.count(1, PAGE_BATCH_SIZE):
+                    batch = range(first, first + PAGE_BATCH_SIZE)
+                    yield from zip(batch, executor.map(get_page, batch))
+
+        # the number of pages isn't known in advance, so pages are requested
+        # in batches until an empty page is seen
+        repos = []
+        for page, (size, repos_on_page) in get_pages():
+            if not size:
+                break
+            # astuple() turns the topics into a tuple; other clients give lists
+            repos.extend(
+                RepositoryMetadata(name, description, list(topics))
+                for name, description, topics in repos_on_page
+            )
+
+        # forget pages past the end, in case there are now fewer repositories
+        for stale_page in [p for p in self.etags if p > page]:
+            del self.etags[stale_page]
 
         return repos
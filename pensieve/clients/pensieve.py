@@ -6,20 +6,116 @@ via STDOUT. We typically communicate with an agent over SSH.
 
 """
 import os
-import json
+import re
+import shlex
 import subprocess
-import collections
+import urllib.parse
 
 from .abc import ClientABC, RepositoryMetadata
+from .. import fastjson
 from ..exceptions import ClientError
 
 
-# how long to wait until the SSH connection is considered dead.
-CONNECTION_TIMEOUT = os.getenv("PENSIEVE_TIMEOUT", 5)
+# the number of seconds in each unit of time that ssh understands
+_TIME_UNITS = {
+    "": 1,
+    "s": 1,
+    "m": 60,
+    "h": 60 * 60,
+    "d": 24 * 60 * 60,
+    "w": 7 * 24 * 60 * 60,
+}
+
+
+def _parse_time(value, default):
+    """Parse a time in the format of ssh's time options, such as "30", "1m" or
+    "1m30s", into seconds. If the time is invalid, `default` is returned."""
+    value = value.strip().lower()
+    if not re.fullmatch(r"(\d+[smhdw]?)+", value):
+        return default
+    parts = re.findall(r"(\d+)([smhdw]?)", value)
+    return sum(int(number) * _TIME_UNITS[unit] for number, unit in parts)
+
+
+# how long to wait until the SSH connection is considered dead, in seconds.
+CONNECTION_TIMEOUT = _parse_time(os.getenv("PENSIEVE_TIMEOUT", "5"), 5)
+
+# how long, once connected, to wait for the agent to respond before giving up
+AGENT_TIMEOUT = 30
 
 # options that should be used when creating an ssh connection
 SSH_OPTIONS = os.getenv("PENSIEVE_SSH_OPTIONS", "")
 
+# if set, the agent command to run instead of the one given for the store
+AGENT_COMMAND = os.getenv("PENSIEVE_AGENT_COMMAND")
+
+# how long a shared ssh connection is kept open after its last use, in the
+# format of ssh's ControlPersist option. "no" disables connection sharing.
+SSH_CONTROL_PERSIST = os.getenv("PENSIEVE_SSH_CONTROL_PERSIST", "60s")
+
+# options that let consecutive ssh connections to the same server share one
+# master connection, so that only the first has to authenticate. ssh uses the
+# first value given for an option, so these come after SSH_OPTIONS, which can
+# override them. the socket is named with %C, a hash of the connection, since
+# a path spelling out the user and host can exceed the length limit on unix
+# sockets, and ssh fails outright when it can't create the socket
+if SSH_CONTROL_PERSIST == "no":
+    SSH_CONTROL_OPTIONS = []
+else:
+    SSH_CONTROL_OPTIONS = [
+        "-o",
+        "ControlMaster=auto",
+        "-o",
+        "ControlPath=~/.ssh/pensieve-%C",
+        "-o",
+        "ControlPersist={}".format(SSH_CONTROL_PERSIST),
+    ]
+
+
+def _make_control_directory():
+    """Create ~/.ssh, where the shared connections' sockets are kept, if it
+    doesn't exist already."""
+    if SSH_CONTROL_OPTIONS:
+        try:
+            os.makedirs(os.path.expanduser("~/.ssh"), mode=0o700, exist_ok=True)
+        except OSError:
+            pass
+
+
+# the options given to ssh on every connection
+_SSH_ARGS = (*SSH_OPTIONS.split(), *SSH_CONTROL_OPTIONS)
+
+# git's ssh connections go through the same shared connection as the agent
+# commands, unless the user has configured git's ssh themselves
+if SSH_CONTROL_OPTIONS and not (os.getenv("GIT_SSH_COMMAND") or os.getenv("GIT_SSH")):
+    _GIT_SSH_COMMAND = shlex.join(("ssh", *_SSH_ARGS))
+else:
+    _GIT_SSH_COMMAND = None
+
+
+def _quote_remote_path(path):
+    """Quote a path for the server's shell, leaving a leading ~ to be expanded
+    to the home directory there."""
+    if path == "~":
+        return path
+    if path.startswith("~/"):
+        return "~/" + shlex.quote(path[2:])
+    return shlex.quote(path)
+
+
+def _is_simple_command(command):
+    """Whether a command line runs a single program, without variable
+    assignments or shell operators, and so can be run with exec."""
+    try:
+        words = shlex.split(command)
+    except ValueError:
+        return False
+    return (
+        bool(words)
+        and "=" not in words[0]
+        and not any(char in command for char in ";&|<>()`$\n")
+    )
+
 
 class PensieveClient(ClientABC):
     """Interact with a store managed by pensieve-agent.
@@ -29,10 +125,12 @@ class PensieveClient(ClientABC):
     host : str
         A string of the form 'ssh://<username>@<hostname_or_ip>:port' describing
         the location of the store. If the string doesn't start with ssh://, it
-        will be added automatically.
+        will be added automatically. The username and port may be omitted, and
+        an IPv6 address must be enclosed in brackets.
     path : str
         A string describing the location of the store on the filesystem of the
-        remote machine.
+        remote machine. It may start with ~ to refer to the home directory, but
+        is otherwise taken literally.
     agent : str
         The path to the pensieve agent binary on the remote machine. If the
         envvar PENSIEVE_AGENT_COMMAND is set, it will be used instead.
@@ -45,12 +143,39 @@ class PensieveClient(ClientABC):
         self.host = host
         self.path = path
 
-        agent_envvar = os.getenv("PENSIEVE_AGENT_COMMAND")
-        if agent_envvar is not None:
-            self.agent = agent_envvar
+        if AGENT_COMMAND is not None:
+            self.agent = AGENT_COMMAND
         else:
             self.agent = agent
 
+        # the command line that runs the agent on the server over ssh is the
+        # same for every invocation, so it is built once
+        url = urllib.parse.urlsplit(self.host)
+        # the hostname is given to ssh without the brackets that an IPv6
+        # address has in the URL
+        server = url.hostname
+        if url.username is not None:
+            server = url.username + "@" + server
+        port = () if url.port is None else ("-p", str(url.port))
+
+        # ssh passes this to the login shell on the server. the agent is a
+        # command line, and so isn't quoted; if it is a plain command, the
+        # shell runs it in its own place
+        remote_command = "cd {} && {}{}".format(
+            _quote_remote_path(self.path),
+            "exec " if _is_simple_command(self.agent) else "",
+            self.agent,
+        )
+        self._ssh_command = (
+            "ssh",
+            "-o",
+            "ConnectTimeout={}".format(CONNECTION_TIMEOUT),
+            *_SSH_ARGS,
+            *port,
+            server,
+            remote_command,
+        )
+
     def _invoke(self, command, data=None):
         """Invoke a pensieve-agent command on the remote server.
 
@@ -86,49 +211,49 @@ class PensieveClient(ClientABC):
 
         # construct the payload as a JSON string
         payload = {"command": command, "data": data}
-        payload_as_json = json.dumps(payload).encode()
+        payload_as_json = fastjson.dumps(payload)
 
-        # construct the command line to run SSH and the command on the server
-        server, port = self.host.rsplit(":", 1)
-        remote_command = "cd {} && {}".format(self.path, self.agent)
-        ssh_command = [
-            "ssh",
-            "-o",
-            "ConnectTimeout={}".format(CONNECTION_TIMEOUT),
-            *SSH_OPTIONS.split(),
-            "-p",
-            port,
-            server,
-            'bash -c "{}"'.format(remote_command),
-        ]
+        _make_control_directory()
 
-        # run that command
-        proc = subprocess.run(
-            ssh_command,
-            input=payload_as_json,
+        # run the agent on the server. a connection that stalls after it is
+        # established would otherwise hang forever, so the whole exchange is
+        # given a time limit
+        with subprocess.Popen(
+            self._ssh_command,
+            stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-        )
-
-        # get the raw string output of the command
-        result = proc.stdout.decode().strip()
-        result_err = proc.stderr.decode().strip()
+        ) as proc:
+            try:
+                stdout, stderr = proc.communicate(
+                    payload_as_json, timeout=CONNECTION_TIMEOUT + AGENT_TIMEOUT
+                )
+            except subprocess.TimeoutExpired:
+                # the pipes are closed rather than drained on the way out, as
+                # whatever is holding them open may never let go
+                proc.kill()
+                raise ClientError("The server did not respond in time.")
+
+        # the output is kept as bytes; it is only decoded to text for an error
+        result = stdout.strip()
 
         # if the process failed...
         if proc.returncode:
+            result = result.decode()
             if "No such file" in result:
                 err = 'The server has no pensieve "{}".'.format(self.path)
             else:
+                result_err = stderr.decode().strip()
                 err = "Connection failed with error: {}".format(result + result_err)
             raise ClientError(err)
 
         # decode the response from JSON into a dictionary
         try:
-            response = json.loads(result)
-        except json.JSONDecodeError:
+            response = fastjson.loads(result)
+        except ValueError:
             err = "Problem decoding when communicating JSON over SSH."
             err += "\nSent: {}".format(payload_as_json)
-            err += "\nReceived: {}".format(result)
+            err += "\nReceived: {}".format(result.decode(errors="replace"))
             raise ClientError(err)
 
         # did the remote agent send back an error?
@@ -159,16 +284,20 @@ class PensieveClient(ClientABC):
             self.host + os.path.join(self.path, repo_name, "repo.git"),
             repo_name,
         ]
-        proc = subprocess.run(
-            command,
-            cwd=str(cwd),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-        )
+        env = None
+        if _GIT_SSH_COMMAND is not None:
+            env = {**os.environ, "GIT_SSH_COMMAND": _GIT_SSH_COMMAND}
+
+        _make_control_directory()
+
+        # git reports errors on stderr, so only that is captured; stdout is
+        # left connected to the terminal rather than buffered here
+        proc = subprocess.run(command, cwd=str(cwd), env=env, stderr=subprocess.PIPE)
 
         if proc.returncode:
             raise ClientError(
-                f'Could not clone the repository "{repo_name}" from the server.'
+                f'Could not clone the repository "{repo_name}" from the server.\n'
+                + proc.stderr.decode().strip()
             )
 
     def new(self, repo_name):
@@ -197,8 +326,7 @@ class PensieveClient(ClientABC):
             and `.topics` attributes.
 
         """
-        repositories = []
-        for name, meta in self._invoke("list").items():
-            repo = RepositoryMetadata(name, meta["description"], sorted(meta["topics"]))
-            repositories.append(repo)
-        return repositories
+        return [
+            RepositoryMetadata(name, meta["description"], sorted(meta["topics"]))
+            for name, meta in self._invoke("list").items()
+        ]
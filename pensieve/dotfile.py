@@ -1,11 +1,14 @@
 """Read a configuration from a .pensieve.yaml file."""
 
-import yaml
+import collections.abc
 
-from .clients import PensieveClient, GitHubClient
 from .exceptions import Error
 
 
+# the client class for each type of store, by its name in .clients
+_CLIENT_TYPES = {"github": "GitHubClient", "pensieve": "PensieveClient"}
+
+
 def _load_client_from_store_config(store, store_config):
     """Read a store config to create a client object.
 
@@ -27,60 +30,168 @@ def _load_client_from_store_config(store, store_config):
         If there was a problem reading the config section.
 
     """
+    # imported here, as the clients pull in their HTTP and subprocess
+    # machinery, which commands that don't use a store can do without
+    from . import clients
+
     invalid_store_msg = f'Invalid "{store}" definition in dotfile. '
-    try:
-        type_ = store_config["type"]
-    except KeyError:
+    type_ = store_config.get("type")
+    if type_ is None:
         raise Error(invalid_store_msg + 'Missing a "type" key.')
 
-    try:
-        Client = {"github": GitHubClient, "pensieve": PensieveClient}[type_]
-    except KeyError:
+    client_name = _CLIENT_TYPES.get(type_)
+    if client_name is None:
         raise Error(invalid_store_msg + f"Unknown client type {type_}.")
+    Client = getattr(clients, client_name)
 
-    # remove type; it isn't needed to create client
-    del store_config["type"]
+    # everything but the type is passed on to the client. the config itself
+    # is left as it is, so that it can be read again
+    params = {key: value for key, value in store_config.items() if key != "type"}
 
     try:
-        client = Client(**store_config)
-    except Exception:
-        raise Error(invalid_store_msg + f"Missing or unknown parameters.")
+        return Client(**params)
+    except TypeError:
+        raise Error(invalid_store_msg + "Missing or unknown parameters.")
+    except ValueError as exc:
+        raise Error(invalid_store_msg + f"{exc}.")
 
-    return client
 
-
-def load(fileobj):
-    """Read a dotfile to create client objects.
+def parse(source):
+    """Parse a YAML dotfile into a configuration dictionary.
 
     Arguments
     ---------
-    fileobj
-        A file-like object containing a YAML dotfile defining stores.
+    source
+        The contents of a YAML dotfile defining stores, either as bytes or a
+        string, or as a file-like object. Passing the whole file as bytes lets
+        libyaml scan a single buffer.
 
     Returns
     -------
-    Dict[Client]
-        A dictionary of clients by name.
+    dict
+        The configuration, as plain Python data.
 
     Raises
     ------
     Error
-        If there was a problem reading the config file.
+        If there was a problem decoding the YAML.
 
     """
+    # imported here, so that a dotfile read from the CLI's cache doesn't need
+    # yaml at all
+    import yaml
+
+    # use the libyaml-backed safe loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     try:
-        config = yaml.load(fileobj, Loader=yaml.Loader)
+        return yaml.load(source, Loader=loader)
     except Exception:
         raise Error("Problem decoding the YAML dotfile.")
 
-    clients = {}
 
+class Clients(collections.abc.Mapping):
+    """The clients defined in a dotfile, by store name.
+
+    Each client is only created when it is first accessed, so commands which
+    don't use every store don't pay to set up every client.
+
+    Arguments
+    ---------
+    stores : dict
+        The "stores" section of a dotfile configuration.
+
+    """
+
+    def __init__(self, stores):
+        self._stores = stores
+        self._clients = {}
+
+    def __getitem__(self, store):
+        """Get the client of a store, creating it if necessary.
+
+        Raises
+        ------
+        KeyError
+            If there is no such store.
+        Error
+            If there was a problem reading the store's definition.
+
+        """
+        if store not in self._clients:
+            store_config = self._stores[store]
+            self._clients[store] = _load_client_from_store_config(store, store_config)
+        return self._clients[store]
+
+    def __contains__(self, store):
+        return store in self._stores
+
+    def __iter__(self):
+        return iter(self._stores)
+
+    def __len__(self):
+        return len(self._stores)
+
+    def close(self):
+        """Close every client which has been created."""
+        for client in self._clients.values():
+            client.close()
+
+
+def from_config(config, lazy=False):
+    """Create client objects from a parsed dotfile configuration.
+
+    Arguments
+    ---------
+    config : dict
+        A configuration as returned by :func:`parse`.
+    lazy : bool
+        If True, each client is created when it is first accessed, and
+        problems with a store's definition are only raised then. Default:
+        False (all clients are created immediately).
+
+    Returns
+    -------
+    Clients
+        A mapping of clients by name.
+
+    Raises
+    ------
+    Error
+        If there was a problem reading the configuration.
+
+    """
     try:
         stores = config["stores"]
     except KeyError:
         raise Error('Invalid dotfile. Missing "stores" key.')
 
-    for store, store_config in stores.items():
-        clients[store] = _load_client_from_store_config(store, store_config)
+    clients = Clients(stores)
+
+    if not lazy:
+        for store in clients:
+            clients[store]
 
     return clients
+
+
+def load(fileobj):
+    """Read a dotfile to create client objects.
+
+    Arguments
+    ---------
+    fileobj
+        A file-like object containing a YAML dotfile defining stores.
+
+    Returns
+    -------
+    Clients
+        A mapping of clients by name.
+
+    Raises
+    ------
+    Error
+        If there was a problem reading the config file.
+
+    """
+    return from_config(parse(fileobj))
@@ -0,0 +1,30 @@
+"""JSON encoding and decoding, using orjson when it is installed.
+
+orjson is an optional dependency (install the "fast" extra). Both functions
+work with bytes, which is what orjson produces and consumes natively, so
+callers can read and write files without a text decoding layer.
+
+"""
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    loads = orjson.loads
+    dumps = orjson.dumps
+else:
+
+    def loads(data):
+        """Decode JSON from bytes or str."""
+        import json
+
+        return json.loads(data)
+
+    def dumps(obj):
+        """Encode an object as UTF-8 JSON bytes."""
+        import json
+
+        return json.dumps(obj, ensure_ascii=False).encode()
@@ -1,14 +0,0 @@
-"""Universal settings."""
-
-
-# the date format used when creating a repo with a date prefix
-DATE_FORMAT = "%Y-%m-%d"
-
-# what should be placed before and after a date when creating a repo with date prefix
-HIGHLIGHT = "__"
-
-# name of the file used to read a pensieve configuration
-DOTFILE = ".pensieve.yaml"
-
-# the file to be used to cache repository metadata
-CACHE_FILENAME = ".cache.json"
@@ -4,6 +4,7 @@ setup(
     name="pensieve",
     version="0.4.0",
     packages=find_packages(),
-    install_requires=["pyyaml", "requests"],
+    install_requires=["pyyaml", "urllib3"],
+    extras_require={"fast": ["orjson"]},
     entry_points={"console_scripts": ["pensieve = pensieve.cli:main"]},
 )
@@ -19,8 +19,7 @@ Feature: Clone a repository
             """
             pensieve clone home:steve
             """
-        Then the output is
+        Then the output begins with
             """
             Could not clone the repository "steve" from the server.
-
             """
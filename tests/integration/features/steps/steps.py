@@ -193,6 +193,12 @@ def step_impl(context):
     assert context.text == output, (context.text, output)
 
 
+@then("the output begins with")
+def step_impl(context):
+    output = context.proc.stdout.decode()
+    assert output.startswith(context.text), (context.text, output)
+
+
 @then('the repository "{name}" exists on the {where}.')
 def step_impl(context, name, where):
     inst = {"client": context.client, "home store": context.server}[where]
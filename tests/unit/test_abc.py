@@ -0,0 +1,18 @@
+import copy
+import pickle
+
+from pensieve.clients.abc import RepositoryMetadata
+
+
+def test_repository_metadata_can_be_copied_and_pickled():
+    # given
+    repo = RepositoryMetadata("repo", "a repository", ["a", "b"])
+
+    # when
+    copied = copy.copy(repo)
+    unpickled = pickle.loads(pickle.dumps(repo))
+
+    # then
+    assert copied == repo
+    assert unpickled == repo
+    assert unpickled.topics == ["a", "b"]
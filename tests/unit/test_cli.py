@@ -0,0 +1,315 @@
+import argparse
+import json
+import textwrap
+
+import pensieve.cli
+from pensieve.clients import GitHubClient
+from pensieve.clients.abc import RepositoryMetadata
+
+import pytest
+
+
+def test_wrap_agrees_with_textwrap():
+    # given
+    msg = "the quick brown fox jumps over the lazy dog " * 5
+
+    # when
+    lines = list(pensieve.cli._wrap(msg, 17))
+
+    # then
+    assert lines == textwrap.wrap(msg, 17)
+
+
+def test_wrap_treats_newlines_and_tabs_like_textwrap():
+    # given
+    msg = "notes for\nthe course\ton data\r\nstructures, with\tsolutions " * 4
+
+    # when
+    results = {width: list(pensieve.cli._wrap(msg, width)) for width in range(6, 40)}
+
+    # then - textwrap may leave spaces at the ends of lines; _wrap doesn't
+    for width, lines in results.items():
+        expected = [line.rstrip() for line in textwrap.wrap(msg, width)]
+        assert lines == expected
+
+
+def test_format_meta_keeps_every_line_indented(monkeypatch):
+    # given
+    monkeypatch.setattr(pensieve.cli, "_columns", lambda: 30)
+    msg = "description: first line\nsecond line that goes on for a while"
+
+    # when
+    lines = pensieve.cli._format_meta(msg, level=1).split("\n")
+
+    # then
+    assert lines[0].startswith("    description")
+    assert all(line.startswith("        ") for line in lines[1:])
+
+
+def test_wrap_splits_words_longer_than_a_line():
+    # given
+    msg = "ab " + "x" * 12 + " cd"
+
+    # when
+    lines = list(pensieve.cli._wrap(msg, 5))
+
+    # then
+    assert lines == ["ab xx", "xxxxx", "xxxxx", "cd"]
+
+
+def test_parse_repository_locator_splits_prefix_and_name():
+    # given
+    clients = {"home": object()}
+
+    # when
+    location = pensieve.cli.parse_repository_locator("home:someone/repo", clients)
+
+    # then
+    assert location.store_name == "home"
+    assert location.user_or_org_prefix == "someone/"
+    assert location.repo_name == "repo"
+    assert location.full_name == "someone/repo"
+
+
+def test_parse_repository_locator_raises_without_store():
+    # when then
+    with pytest.raises(ValueError):
+        pensieve.cli.parse_repository_locator("repo", {"home": object()})
+
+
+def test_parse_repository_locator_raises_with_more_than_one_slash():
+    # when then
+    with pytest.raises(ValueError):
+        pensieve.cli.parse_repository_locator("home:a/b/c", {"home": object()})
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    """Point the repository cache at a temporary directory."""
+
+    def use(path):
+        monkeypatch.setenv("PENSIEVE_CACHE_PATH", str(path))
+        pensieve.cli._cache_path.cache_clear()
+        pensieve.cli._CACHE_MEMO.clear()
+        return path
+
+    yield use
+    pensieve.cli._cache_path.cache_clear()
+    pensieve.cli._CACHE_MEMO.clear()
+
+
+LEGACY_CACHE = {
+    "home": [
+        {"name": "zeta", "description": "last", "topics": ["b", "a"]},
+        {"name": "alpha", "description": None, "topics": []},
+    ],
+    "github": [{"name": "me/repo", "description": "d", "topics": ["x"]}],
+}
+
+
+def test_read_cache_migrates_legacy_cache_to_shards(tmp_path, cache_path):
+    # given
+    cache_path(tmp_path / "cache")
+    (tmp_path / "cache.json").write_text(json.dumps(LEGACY_CACHE))
+
+    # when
+    cache = pensieve.cli._read_cache()
+
+    # then
+    assert not (tmp_path / "cache.json").exists()
+    assert sorted(cache) == ["github", "home"]
+    assert cache["home"] == [
+        ("alpha", None, frozenset()),
+        ("zeta", "last", frozenset({"a", "b"})),
+    ]
+
+    # and a second read uses the shards
+    pensieve.cli._CACHE_MEMO.clear()
+    assert pensieve.cli._read_cache()["github"] == [("me/repo", "d", frozenset("x"))]
+
+
+def test_read_cache_keeps_shards_newer_than_legacy_cache(tmp_path, cache_path):
+    # given
+    cache_path(tmp_path / "cache")
+    pensieve.cli._write_shard("home", [("new", "d", ["t"])])
+    (tmp_path / "cache.json").write_text(json.dumps(LEGACY_CACHE))
+
+    # when
+    cache = pensieve.cli._read_cache()
+
+    # then
+    assert cache["home"] == [("new", "d", frozenset({"t"}))]
+    assert len(cache["github"]) == 1
+
+
+def test_read_cache_with_cache_path_ending_in_json(tmp_path, cache_path):
+    # given - the old cache is where the cache directory goes
+    path = cache_path(tmp_path / "cache.json")
+    path.write_text(json.dumps(LEGACY_CACHE))
+
+    # when
+    first = pensieve.cli._read_cache()
+    pensieve.cli._write_shard("other", [("repo", None, [])])
+    second = pensieve.cli._read_cache()
+
+    # then
+    assert path.is_dir()
+    assert sorted(first) == ["github", "home"]
+    assert sorted(second) == ["github", "home", "other"]
+
+
+def test_write_shard_sorts_repos_by_name(tmp_path, cache_path):
+    # given
+    cache_path(tmp_path / "cache")
+
+    # when
+    pensieve.cli._write_shard("home", [("b", None, []), ("a", None, [])])
+
+    # then
+    pensieve.cli._CACHE_MEMO.clear()
+    assert [name for name, _, _ in pensieve.cli._read_cache()["home"]] == ["a", "b"]
+
+
+DOTFILE = """
+stores:
+    github:
+        type: github
+        user: pensieve-test-user
+        token: abcdef
+"""
+
+
+@pytest.fixture
+def dotfile_path(tmp_path, monkeypatch, cache_path):
+    """Write a dotfile and point the CLI at it, with a cache alongside."""
+    path = tmp_path / "pensieve.yaml"
+    path.write_text(DOTFILE)
+    monkeypatch.setenv("PENSIEVE_CONFIG_PATH", str(path))
+    pensieve.cli._config_path.cache_clear()
+    cache_path(tmp_path / "cache")
+
+    parses = []
+    parse = pensieve.dotfile.parse
+    monkeypatch.setattr(
+        pensieve.dotfile, "parse", lambda source: parses.append(source) or parse(source)
+    )
+
+    yield path, parses
+    pensieve.cli._config_path.cache_clear()
+
+
+def test_load_clients_parses_dotfile_only_when_it_changes(dotfile_path):
+    # given
+    path, parses = dotfile_path
+
+    # when
+    first = pensieve.cli._load_clients()
+    second = pensieve.cli._load_clients()
+    path.write_text(DOTFILE.replace("abcdef", "a-longer-token"))
+    third = pensieve.cli._load_clients()
+
+    # then
+    assert len(parses) == 2
+    assert first["github"].token == second["github"].token == "abcdef"
+    assert third["github"].token == "a-longer-token"
+
+
+def test_load_clients_ignores_cache_writable_by_others(dotfile_path):
+    # given
+    path, parses = dotfile_path
+    pensieve.cli._load_clients()
+    pensieve.cli._dotfile_cache_path().chmod(0o666)
+
+    # when
+    pensieve.cli._load_clients()
+
+    # then
+    assert len(parses) == 2
+
+
+class ListedGitHubClient(GitHubClient):
+    """A GitHub client whose listing records the ETags it started with."""
+
+    def __init__(self):
+        super().__init__("me", "token")
+        self.etags_before_listing = None
+
+    def list(self):
+        self.etags_before_listing = dict(self.etags)
+        self.etags = {1: ('"v1"', 1, [("me/repo", None, ("t",))])}
+        return [RepositoryMetadata("me/repo", None, ["t"])]
+
+
+def test_cmd_list_saves_and_restores_github_etags(tmp_path, cache_path, capsys):
+    # given
+    cache_path(tmp_path / "cache")
+    first, second = ListedGitHubClient(), ListedGitHubClient()
+
+    # when
+    for client in (first, second):
+        args = argparse.Namespace(
+            clients={"github": client}, topic=None, show_archived=False
+        )
+        pensieve.cli.cmd_list(args)
+
+    # then
+    assert first.etags_before_listing == {}
+    assert second.etags_before_listing == first.etags
+    assert "me/repo" in capsys.readouterr().out
+
+
+def test_read_cache_ignores_shards_writable_by_others(tmp_path, cache_path):
+    # given
+    cache_path(tmp_path / "cache")
+    pensieve.cli._write_shard("home", [("repo", None, [])])
+    pensieve.cli._shard_path("home").chmod(0o666)
+    pensieve.cli._CACHE_MEMO.clear()
+
+    # when
+    cache = pensieve.cli._read_cache()
+
+    # then
+    assert cache["home"] == []
+
+
+def test_read_etags_ignores_files_writable_by_others(tmp_path, cache_path):
+    # given
+    cache_path(tmp_path / "cache")
+    pensieve.cli._write_etags("github", {1: ('"v1"', 0, [])})
+    assert pensieve.cli._read_etags("github") == {1: ('"v1"', 0, [])}
+
+    # when
+    pensieve.cli._etags_path("github").chmod(0o666)
+
+    # then
+    assert pensieve.cli._read_etags("github") == {}
+
+
+def test_read_cache_migrates_legacy_cache_at_cache_path(tmp_path, cache_path):
+    # given - PENSIEVE_CACHE_PATH names an old cache file without a suffix
+    path = cache_path(tmp_path / "oldcache")
+    path.write_text(json.dumps(LEGACY_CACHE))
+
+    # when
+    cache = pensieve.cli._read_cache()
+
+    # then
+    assert path.is_dir()
+    assert sorted(cache) == ["github", "home"]
+
+
+def test_cmd_list_migrates_legacy_cache_before_writing(tmp_path, cache_path, capsys):
+    # given
+    path = cache_path(tmp_path / "oldcache")
+    path.write_text(json.dumps(LEGACY_CACHE))
+    args = argparse.Namespace(
+        clients={"github": ListedGitHubClient()}, topic=None, show_archived=False
+    )
+
+    # when
+    pensieve.cli.cmd_list(args)
+
+    # then
+    cache = pensieve.cli._read_cache()
+    assert sorted(cache) == ["github", "home"]
+    assert cache["github"] == [("me/repo", None, frozenset({"t"}))]
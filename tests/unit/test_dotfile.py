@@ -64,3 +64,53 @@ def test_load_raises_if_missing_attribute():
 
     with pytest.raises(pensieve.exceptions.Error):
         pensieve.dotfile.load(fileobj)
+
+
+def test_parse_accepts_bytes():
+    # when
+    config = pensieve.dotfile.parse(EXAMPLE.encode())
+
+    # then
+    assert config["stores"]["github"]["user"] == "pensieve-test-user"
+
+
+def test_from_config_lazy_defers_errors_until_store_is_accessed():
+    # given - missing "agent" in home
+    config = {
+        "stores": {
+            "home": {"type": "pensieve", "host": "tester@0.0.0.0:1234", "path": "/"},
+            "github": {"type": "github", "user": "pensieve-test-user", "token": "x"},
+        }
+    }
+
+    # when
+    clients = pensieve.dotfile.from_config(config, lazy=True)
+
+    # then
+    assert "home" in clients
+    assert clients["github"].user == "pensieve-test-user"
+
+    with pytest.raises(pensieve.exceptions.Error):
+        clients["home"]
+
+
+def test_from_config_does_not_modify_config():
+    # given
+    config = pensieve.dotfile.parse(EXAMPLE)
+
+    # when
+    pensieve.dotfile.from_config(config)
+
+    # then
+    assert config["stores"]["home"]["type"] == "pensieve"
+    assert config["stores"]["github"]["type"] == "github"
+
+
+def test_from_config_raises_on_bad_port():
+    # given
+    store = {"type": "pensieve", "host": "me@host:ssh", "path": "/p", "agent": "a"}
+    config = {"stores": {"home": store}}
+
+    # when then
+    with pytest.raises(pensieve.exceptions.Error):
+        pensieve.dotfile.from_config(config)["home"]
@@ -0,0 +1,104 @@
+import collections
+import json
+import threading
+
+import pensieve.clients.github
+
+import pytest
+
+
+Response = collections.namedtuple("Response", "status data headers")
+
+
+class StubPool:
+    """Stands in for urllib3.PoolManager, serving an account's repo listing.
+
+    Pages carry an ETag which changes only when the repos on the page change,
+    and requests with a matching If-None-Match get a 304 with no body.
+
+    """
+
+    def __init__(self, n_repos):
+        self.n_repos = n_repos
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def _page(self, page):
+        first = (page - 1) * 100
+        return [
+            {
+                "full_name": f"me/repo-{i:04d}",
+                "description": None,
+                "topics": ["b", "a"],
+                "permissions": {"admin": True},
+            }
+            for i in range(first, min(first + 100, self.n_repos))
+        ]
+
+    def request(self, method, url, fields, headers):
+        page = int(fields["page"])
+        repos = self._page(page)
+        etag = f'"{page}-{len(repos)}"'
+
+        if headers.get("If-None-Match") == etag:
+            status, data = 304, b""
+        else:
+            status, data = 200, json.dumps(repos).encode()
+
+        with self._lock:
+            self.requests.append((page, status))
+        return Response(status, data, {"ETag": etag})
+
+    def statuses(self):
+        return dict(self.requests)
+
+
+@pytest.fixture
+def client():
+    client = pensieve.clients.github.GitHubClient("me", "token")
+    client._pool = StubPool(250)
+    return client
+
+
+def test_list_reads_every_page(client):
+    # when
+    repos = client.list()
+
+    # then
+    assert len(repos) == 250
+    assert repos[0].name == "me/repo-0000"
+    assert repos[0].topics == ["a", "b"]
+    # pages are requested in batches of eight; those after the first empty
+    # one may be cancelled before they are sent
+    assert {1, 2, 3, 4} <= set(client._pool.statuses()) <= set(range(1, 9))
+    assert sorted(client.etags) == [1, 2, 3, 4]
+
+
+def test_list_reuses_unchanged_pages(client):
+    # given
+    first = client.list()
+    client._pool.requests.clear()
+
+    # when
+    second = client.list()
+
+    # then
+    assert second == first
+    statuses = client._pool.statuses()
+    assert [statuses[page] for page in [1, 2, 3, 4]] == [304, 304, 304, 304]
+
+
+def test_list_forgets_pages_past_the_end(client):
+    # given
+    client.list()
+    client._pool.n_repos = 150
+    client._pool.requests.clear()
+
+    # when
+    repos = client.list()
+
+    # then
+    assert len(repos) == 150
+    statuses = client._pool.statuses()
+    assert [statuses[page] for page in [1, 2, 3]] == [304, 200, 200]
+    assert sorted(client.etags) == [1, 2, 3]
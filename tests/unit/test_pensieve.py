@@ -0,0 +1,69 @@
+import pensieve.clients.pensieve
+
+import pytest
+
+
+def test_parse_time_understands_ssh_time_formats():
+    # when then
+    assert pensieve.clients.pensieve._parse_time("30", 5) == 30
+    assert pensieve.clients.pensieve._parse_time("1m", 5) == 60
+    assert pensieve.clients.pensieve._parse_time("1m30s", 5) == 90
+
+
+def test_parse_time_falls_back_to_default_when_invalid():
+    # when then
+    assert pensieve.clients.pensieve._parse_time("soon", 5) == 5
+    assert pensieve.clients.pensieve._parse_time("", 5) == 5
+
+
+def _remote_command(path, agent):
+    client = pensieve.clients.pensieve.PensieveClient("me@host", path, agent)
+    return client._ssh_command[-1]
+
+
+def test_client_quotes_path_but_expands_home_directory():
+    # when
+    absolute = _remote_command("/home/me/my store", "agent")
+    in_home = _remote_command("~/my store", "agent")
+
+    # then
+    assert absolute == "cd '/home/me/my store' && exec agent"
+    assert in_home == "cd ~/'my store' && exec agent"
+
+
+def test_client_execs_only_plain_agent_commands():
+    # when
+    plain = _remote_command("/p", "/bin/agent --flag")
+    assignment = _remote_command("/p", "VAR=x agent")
+    compound = _remote_command("/p", "source env && agent")
+
+    # then
+    assert plain == "cd /p && exec /bin/agent --flag"
+    assert assignment == "cd /p && VAR=x agent"
+    assert compound == "cd /p && source env && agent"
+
+
+def _ssh_destination(host):
+    """The port and destination that ssh is given for a store's host."""
+    command = pensieve.clients.pensieve.PensieveClient(host, "/p", "a")._ssh_command
+    port = command[command.index("-p") + 1] if "-p" in command else None
+    return port, command[-2]
+
+
+def test_client_parses_host():
+    # when then
+    assert _ssh_destination("tester@0.0.0.0:1234") == ("1234", "tester@0.0.0.0")
+    assert _ssh_destination("ssh://me@example.com:22") == ("22", "me@example.com")
+    assert _ssh_destination("tester@example.com") == (None, "tester@example.com")
+    assert _ssh_destination("example.com") == (None, "example.com")
+
+
+def test_client_parses_ipv6_host():
+    # when then
+    assert _ssh_destination("tester@[::1]:2222") == ("2222", "tester@::1")
+
+
+def test_client_raises_on_bad_port():
+    # when then
+    with pytest.raises(ValueError):
+        pensieve.clients.pensieve.PensieveClient("me@example.com:ssh", "/p", "a")